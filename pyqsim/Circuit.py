@@ -30,14 +30,15 @@ class Circuit:
             self.gates.append(gate)
         else:
             desired_state = gate.controls + gate.targets
-            desired_state += [qubit for qubit in self.register.qubits if qubit not in desired_state]
-            swaps = obtain_swaps(tuple(self.register.qubits), tuple(desired_state))
+            desired_state += tuple(qubit for qubit in self.register.qubits if qubit not in desired_state)
+            swaps = obtain_swaps(tuple(self.register.qubits), desired_state)
             reverse_swaps = swaps[::-1]
             self.gates += [SWAP(qubit_0, qubit_1, self.register.num_qubits) for qubit_0, qubit_1 in swaps]
             self.gates.append(gate)
             self.gates += [SWAP(qubit_0, qubit_1, self.register.num_qubits) for qubit_0, qubit_1 in reverse_swaps]
 
     def run(self):
+        apply_gate = self.register.apply_gate
         for gate in self.gates:
-            self.register.apply_gate(gate)
+            apply_gate(gate)
         return self.register
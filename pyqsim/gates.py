@@ -1,51 +1,122 @@
 from functools import lru_cache
-from typing import List, Type
+from typing import Sequence, Tuple
 
 import numpy as np
 
 
+def canonical_matrix(matrix: np.ndarray) -> np.ndarray:
+    """Return a read-only copy of a matrix so it can be shared among gate instances."""
+    matrix = np.array(matrix, copy=True)
+    matrix.setflags(write=False)
+    return matrix
+
+
 class Gate(object):
+    """Lightweight gate record.
+
+    Instances only hold the qubit indices they act on. The matrix and the gate size are
+    shared at class level, so large circuits stay small in memory and cheap to pickle.
+    Subclasses only need to define ``matrix``.
+    """
+
+    __slots__ = ("qubits",)
+
     matrix: np.ndarray
     gate_size: int
-    controls: List[int] = []
-    targets: List[int] = []
-    qubits: List[int] = []
+    qubits: Tuple[int, ...]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if isinstance(cls.__dict__.get("matrix"), np.ndarray):
+            cls._set_matrix(cls.matrix)
 
     def __init__(self, *qubits: int) -> None:
-        self.gate_size = np.log2(self.matrix.shape[0]).astype(int)
+        if getattr(type(self), "gate_size", None) is None:
+            raise TypeError(f"{type(self).__name__} has no matrix, define one or use from_matrix")
         self.assign_qubits(qubits)
 
-    def assign_qubits(self, qubits):
-        self.targets = list([qubits[-1]])
-        self.controls = list(qubits[:-1])
-        self.qubits = list(qubits)
+    def assign_qubits(self, qubits: Sequence[int]):
+        self.qubits = tuple(qubits)
+
+    @property
+    def targets(self) -> Tuple[int, ...]:
+        return self.qubits[-1:]
+
+    @property
+    def controls(self) -> Tuple[int, ...]:
+        return self.qubits[:-1]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(map(str, self.qubits))})"
+
+    @classmethod
+    def _set_matrix(cls, matrix: np.ndarray):
+        cls.matrix = canonical_matrix(matrix)
+        cls.gate_size = int(cls.matrix.shape[0]).bit_length() - 1
 
     @classmethod
     def from_matrix(cls, matrix: np.ndarray):
-        cls.matrix = matrix
-        return cls
+        """Return a new subclass of the gate using the given matrix. The gate itself is left untouched."""
+        return type(cls.__name__, (cls,), {"__slots__": (), "matrix": matrix})
 
 
 class H(Gate):
+    __slots__ = ()
     matrix = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
 
 
 class X(Gate):
+    __slots__ = ()
     matrix = np.array([[0, 1], [1, 0]], dtype=bool)
 
 
 class CX(Gate):
+    __slots__ = ()
     matrix = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]], dtype=bool)
 
 
 class SWAP(Gate):
+    """Swap of two qubits expressed over the whole register.
+
+    Only the swapped qubits and the register size are stored; the matrix is taken from the
+    shared ``get_swap_matrix`` cache when needed.
+    """
+
+    __slots__ = ("qubit_0", "qubit_1", "register_size")
+
     def __init__(self, qubit_0: int, qubit_1: int, register_size: int):
-        self.matrix = get_swap_matrix(qubit_0, qubit_1, register_size)
-        super().__init__(qubit_0, qubit_1)
+        self.qubit_0 = qubit_0
+        self.qubit_1 = qubit_1
+        self.register_size = register_size
+
+    def assign_qubits(self, qubits: Sequence[int]):
+        """SWAP acts on the whole register, so its qubits are derived from ``register_size``."""
+
+    @property
+    def matrix(self) -> np.ndarray:
+        return get_swap_matrix(self.qubit_0, self.qubit_1, self.register_size)
+
+    @property
+    def gate_size(self) -> int:
+        return self.register_size
+
+    @property
+    def qubits(self) -> range:
+        return range(1 << self.register_size)
+
+    @property
+    def targets(self) -> Tuple[int, ...]:
+        return tuple(self.qubits)
+
+    @property
+    def controls(self) -> Tuple[int, ...]:
+        return ()
+
+    def __reduce__(self):
+        return SWAP, (self.qubit_0, self.qubit_1, self.register_size)
 
-    def assign_qubits(self, qubits):
-        self.targets = list(range(self.matrix.shape[0]))
-        self.qubits = list(range(self.matrix.shape[0]))
+    def __repr__(self):
+        return f"SWAP({self.qubit_0}, {self.qubit_1}, {self.register_size})"
 
 
 @lru_cache(maxsize=None)
@@ -62,4 +133,4 @@ def get_swap_matrix(qubit_0: int, qubit_1: int, register_size: int) -> np.ndarra
             swap_matrix[q1_index, q1_index] = 0
             swap_matrix[q0_index, q1_index] = 1
             swap_matrix[q1_index, q0_index] = 1
-    return swap_matrix
+    return canonical_matrix(swap_matrix)
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 import numpy as np
@@ -11,17 +12,17 @@ class TestGates(unittest.TestCase):
         x_1 = gates.X(1)
 
         self.assertEqual(x.gate_size, 1)
-        self.assertEqual(x.controls, [])
-        self.assertEqual(x.targets, [0])
-        self.assertEqual(x_1.targets, [1])
+        self.assertEqual(x.controls, ())
+        self.assertEqual(x.targets, (0,))
+        self.assertEqual(x_1.targets, (1,))
         self.assertEqual(x.matrix.size, 4)
 
     def test_CX(self):
         cx = gates.CX(0, 1)
 
         self.assertEqual(cx.gate_size, 2)
-        self.assertEqual(cx.controls, [0])
-        self.assertEqual(cx.targets, [1])
+        self.assertEqual(cx.controls, (0,))
+        self.assertEqual(cx.targets, (1,))
         self.assertEqual(cx.matrix.size, 16)
 
     def test_SWAP(self):
@@ -29,14 +30,98 @@ class TestGates(unittest.TestCase):
         swap_1023 = gates.SWAP(0, 1, register_size)
 
         self.assertEqual(swap_1023.gate_size, 2)
-        self.assertEqual(swap_1023.controls, [])
-        self.assertEqual(swap_1023.targets, list(range(1 << register_size)))
+        self.assertEqual(swap_1023.controls, ())
+        self.assertEqual(swap_1023.targets, tuple(range(1 << register_size)))
         self.assertEqual(swap_1023.matrix.tolist(),
                          [[True, False, False, False],
                           [False, False, True, False],
                           [False, True, False, False],
                           [False, False, False, True]])
 
+    def test_SWAP_larger_register(self):
+        register_size = 3
+        swap = gates.SWAP(0, 2, register_size)
+
+        self.assertEqual(swap.gate_size, register_size)
+        self.assertEqual(swap.targets, tuple(range(1 << register_size)))
+        self.assertEqual(list(swap.qubits), list(range(1 << register_size)))
+        self.assertEqual(swap.matrix.shape, (1 << register_size, 1 << register_size))
+        self.assertFalse(hasattr(swap, "__dict__"))
+
+        swap.assign_qubits((0, 1))
+        self.assertEqual(swap.targets, tuple(range(1 << register_size)))
+
+    def test_from_matrix(self):
+        matrix = np.array([[0, -1j], [1j, 0]])
+
+        class Y(gates.Gate):
+            __slots__ = ()
+
+        y_gate = Y.from_matrix(matrix)
+        y = y_gate(1)
+
+        self.assertTrue(issubclass(y_gate, Y))
+        self.assertFalse(hasattr(Y, "matrix"))
+        self.assertEqual(y.gate_size, 1)
+        self.assertEqual(y.targets, (1,))
+        self.assertIs(y.matrix, y_gate(0).matrix)
+        self.assertFalse(y.matrix.flags.writeable)
+        self.assertFalse(hasattr(y, "__dict__"))
+        self.assertTrue(matrix.flags.writeable)
+        matrix[0, 0] = 1
+        self.assertEqual(y.matrix[0, 0], 0)
+
+    def test_from_matrix_on_gate(self):
+        gate = gates.Gate.from_matrix(np.eye(2))(0)
+
+        self.assertEqual(gate.qubits, (0,))
+        self.assertEqual(gate.gate_size, 1)
+        self.assertFalse(hasattr(gates.Gate, "matrix"))
+        self.assertEqual(gates.X.matrix.tolist(), [[False, True], [True, False]])
+        self.assertEqual(gates.CX.gate_size, 2)
+
+    def test_missing_matrix(self):
+        class Y(gates.Gate):
+            pass
+
+        with self.assertRaises(TypeError):
+            Y(0)
+        with self.assertRaises(TypeError):
+            gates.Gate(0)
+
+    def test_class_level_matrix(self):
+        cz_matrix = np.diag([1, 1, 1, -1]).astype(complex)
+
+        class CZ(gates.Gate):
+            __slots__ = ()
+            matrix = cz_matrix
+
+        cz = CZ(0, 1)
+
+        self.assertEqual(cz.gate_size, 2)
+        self.assertEqual(cz.controls, (0,))
+        self.assertEqual(cz.targets, (1,))
+        self.assertFalse(cz.matrix.flags.writeable)
+        self.assertIsNot(cz.matrix, cz_matrix)
+        self.assertTrue(cz_matrix.flags.writeable)
+        self.assertFalse(hasattr(cz, "__dict__"))
+
+    def test_matrix_is_shared(self):
+        x, x_1 = gates.X(0), gates.X(1)
+
+        self.assertIs(x.matrix, x_1.matrix)
+        self.assertFalse(x.matrix.flags.writeable)
+        self.assertFalse(hasattr(x, "__dict__"))
+        self.assertIs(gates.SWAP(0, 1, 2).matrix, gates.SWAP(0, 1, 2).matrix)
+
+    def test_pickle(self):
+        for gate in (gates.H(1), gates.CX(0, 1), gates.SWAP(0, 1, 2)):
+            restored = pickle.loads(pickle.dumps(gate))
+
+            self.assertIsInstance(restored, type(gate))
+            self.assertEqual(list(restored.qubits), list(gate.qubits))
+            self.assertEqual(restored.matrix.tolist(), gate.matrix.tolist())
+
 
 if __name__ == '__main__':
     unittest.main()